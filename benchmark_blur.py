@@ -0,0 +1,58 @@
+# compare the per-frame UMat blur against the batched CPU blur on synthetic frames
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from blur_pipeline.processing import BatchBoxBlur, blur_frame
+
+
+def bench_umat(frames: np.ndarray, k: int, use_opencl: bool) -> float:
+    cv2.ocl.setUseOpenCL(use_opencl)
+    t0 = time.perf_counter()
+    for frame in frames:
+        blur_frame(frame, k)
+    return time.perf_counter() - t0
+
+
+def bench_batched(frames: np.ndarray, k: int, batch_size: int) -> float:
+    n, h, w, _ = frames.shape
+    batch = BatchBoxBlur(batch_size, h, w, k)
+    t0 = time.perf_counter()
+    for start in range(0, n, batch_size):
+        chunk = frames[start:start + batch_size]
+        batch.frames[:len(chunk)] = chunk
+        batch.blur(len(chunk))
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark blur backends")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--frames", type=int, default=64)
+    parser.add_argument("--k", type=int, default=21, help="Odd blur kernel size (default: 21)")
+    parser.add_argument("--batch-size", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, (args.frames, args.height, args.width, 3), dtype=np.uint8)
+
+    # warm up OpenCL kernels and numpy allocations
+    bench_umat(frames[:2], args.k, use_opencl=True)
+    bench_batched(frames[:2], args.k, args.batch_size)
+
+    print(f"{args.frames} frames at {args.width}x{args.height}, k={args.k}")
+    results = {
+        "UMat per-frame (OpenCL on)": bench_umat(frames, args.k, use_opencl=True),
+        "UMat per-frame (OpenCL off)": bench_umat(frames, args.k, use_opencl=False),
+        f"Batched cumsum (batch={args.batch_size})": bench_batched(frames, args.k, args.batch_size),
+    }
+    for name, elapsed in results.items():
+        print(f"  {name}: {elapsed:.2f}s ({args.frames / elapsed:.1f} fps)")
+
+
+if __name__ == "__main__":
+    main()
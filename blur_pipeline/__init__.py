@@ -1,6 +1,6 @@
 from .config import ProcessingConfig, OutputPaths, ProcessedVideo
 from .pipeline import VideoBlurPipeline
-from .processing import get_blur_strength, process_video
+from .processing import BatchBoxBlur, get_blur_strength, process_video
 from .audio import mux_audio
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     "OutputPaths",
     "ProcessedVideo",
     "VideoBlurPipeline",
+    "BatchBoxBlur",
     "get_blur_strength",
     "process_video",
     "mux_audio",
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+BLUR_BACKENDS = ("cv2", "batched")
+
 
 @dataclass
 class OutputPaths:
@@ -17,6 +19,8 @@ class ProcessingConfig:
     source_video: Path
     output_video: Path
     sample_frames: int = 500
+    use_opencl: bool = True
+    blur_backend: str = "cv2"
 
     def derived_paths(self) -> OutputPaths:
         self.output_video.parent.mkdir(parents=True, exist_ok=True)
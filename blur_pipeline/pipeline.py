@@ -117,6 +117,8 @@ class VideoBlurPipeline:
             max_frames=sample_length,
             description="Sample",
             start_frame=start_frame,
+            use_opencl=self.config.use_opencl,
+            blur_backend=self.config.blur_backend,
         )
         mux_audio(
             str(self.config.source_video),
@@ -135,6 +137,8 @@ class VideoBlurPipeline:
             k_size,
             max_frames=None,
             description="Full Video",
+            use_opencl=self.config.use_opencl,
+            blur_backend=self.config.blur_backend,
         )
         t1 = time.perf_counter()
         print(f"[LATENCY] Video blur processing: {t1-t0:.2f}s")
@@ -1,7 +1,7 @@
 
 from pathlib import Path
 import argparse
-from blur_pipeline.config import ProcessingConfig
+from blur_pipeline.config import BLUR_BACKENDS, ProcessingConfig
 from blur_pipeline.pipeline import VideoBlurPipeline
 
 import cv2
@@ -40,6 +40,8 @@ def main() -> None:
     parser.add_argument("--debug", action="store_true", help="Print video metadata for debugging")
     parser.add_argument("--cfr-fps", type=float, default=30, help="Convert input video to CFR at this FPS (default: 30)")
     parser.add_argument("--no-cfr", action="store_true", help="Skip CFR conversion and use original video for blurring and audio passthrough")
+    parser.add_argument("--no-opencl", action="store_true", help="Disable OpenCL for the cv2 blur")
+    parser.add_argument("--blur-backend", choices=BLUR_BACKENDS, default="cv2", help="cv2 (default) blurs each frame with cv2.blur; batched blurs chunks of frames with NumPy, which benchmarks slower than cv2")
     args = parser.parse_args()
 
     source_path = "../Tuesday_mini.mp4"
@@ -80,6 +82,8 @@ def main() -> None:
         source_video=Path(selected_video),
         output_video=Path("results/blurred_output.mp4"),
         sample_frames=5,
+        use_opencl=not args.no_opencl,
+        blur_backend=args.blur_backend,
     )
     t1 = time.perf_counter()
     print(f"[LATENCY] Config initialization: {t1-t0:.2f}s")
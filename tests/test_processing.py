@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+
+from blur_pipeline import pipeline
+from blur_pipeline.config import ProcessedVideo, ProcessingConfig
+from blur_pipeline.processing import BatchBoxBlur, process_video
+
+
+@pytest.mark.parametrize("k", [1, 3, 9, 31])
+def test_batch_box_blur_matches_cv2(k):
+    """Batched blur should match cv2.blur frame by frame, including borders."""
+    rng = np.random.default_rng(k)
+    batch = BatchBoxBlur(batch_size=4, height=40, width=56, k=k)
+    batch.frames[:3] = rng.integers(0, 256, (3, 40, 56, 3), dtype=np.uint8)
+
+    blurred = batch.blur(3)
+
+    expected = np.stack([cv2.blur(frame, (k, k)) for frame in batch.frames[:3]])
+    assert blurred.shape == (3, 40, 56, 3)
+    assert np.abs(blurred.astype(int) - expected).max() <= 1
+
+
+def test_batch_box_blur_reuses_buffers():
+    """Repeated calls should write into the same preallocated output buffer."""
+    batch = BatchBoxBlur(batch_size=2, height=8, width=8, k=3)
+    batch.frames[:] = 200
+    first = batch.blur(2)
+    batch.frames[:] = 10
+    second = batch.blur(1)
+
+    assert np.shares_memory(first, batch.output)
+    assert np.shares_memory(second, batch.output)
+    assert (second == 10).all()
+
+
+def test_batch_box_blur_rejects_bad_kernel():
+    """Even kernels and kernels wider than the frame are rejected."""
+    with pytest.raises(ValueError):
+        BatchBoxBlur(batch_size=1, height=8, width=8, k=4)
+    with pytest.raises(ValueError):
+        BatchBoxBlur(batch_size=1, height=8, width=8, k=17)
+
+
+def _write_video(path, frame_count=10, size=(64, 48), fps=10.0):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    rng = np.random.default_rng(0)
+    for _ in range(frame_count):
+        writer.write(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8))
+    writer.release()
+
+
+@pytest.mark.parametrize("use_opencl", [True, False])
+@pytest.mark.parametrize("blur_backend", ["cv2", "batched"])
+def test_process_video_writes_all_frames(tmp_path, use_opencl, blur_backend):
+    """process_video should blur every frame on each backend, with or without OpenCL."""
+    source = tmp_path / "source.mp4"
+    output = tmp_path / "out.mp4"
+    _write_video(source, frame_count=10)
+
+    result = process_video(
+        str(source),
+        str(output),
+        5,
+        max_frames=None,
+        description="Test",
+        use_opencl=use_opencl,
+        blur_backend=blur_backend,
+    )
+
+    assert result.frame_count == 10
+    cap = cv2.VideoCapture(str(output))
+    assert int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) == 64
+    assert int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) == 48
+    assert int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) == 10
+    cap.release()
+
+
+def test_process_video_rejects_unknown_backend(tmp_path):
+    """Unknown blur backends are rejected before the video is opened."""
+    with pytest.raises(ValueError):
+        process_video(str(tmp_path / "in.mp4"), str(tmp_path / "out.mp4"), 5, None, "Test", blur_backend="gpu")
+
+
+def test_pipeline_passes_blur_settings(tmp_path, monkeypatch):
+    """VideoBlurPipeline should forward use_opencl and blur_backend to process_video."""
+    source = tmp_path / "source.mp4"
+    _write_video(source, frame_count=10)
+    config = ProcessingConfig(
+        source_video=source,
+        output_video=tmp_path / "results" / "out.mp4",
+        sample_frames=5,
+        use_opencl=False,
+        blur_backend="batched",
+    )
+    calls = []
+
+    def fake_process_video(*args, **kwargs):
+        calls.append(kwargs)
+        return ProcessedVideo(path=tmp_path / "video.mp4", frame_count=5, fps=10.0)
+
+    monkeypatch.setattr(pipeline, "process_video", fake_process_video)
+    monkeypatch.setattr(pipeline, "mux_audio", lambda *args, **kwargs: None)
+    monkeypatch.setattr(pipeline.subprocess, "run", lambda *args, **kwargs: SimpleNamespace(returncode=1))
+
+    vbp = pipeline.VideoBlurPipeline(config)
+    vbp._render_sample(5)
+    vbp._render_full(5)
+
+    assert len(calls) == 2
+    for kwargs in calls:
+        assert kwargs["use_opencl"] is False
+        assert kwargs["blur_backend"] == "batched"